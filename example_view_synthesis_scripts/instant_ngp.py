@@ -3,8 +3,8 @@ import argparse
 import os
 import commentjson as json
 import numpy as np
-import io
-import pickle
+import struct
+from multiprocessing import shared_memory
 
 
 def create_args_parser():
@@ -51,32 +51,51 @@ def create_args_parser():
         "--temp_json_ifp", default="", help="Path to the temporary json file."
     )
     parser.add_argument(
-        "--temp_array_ofp",
+        "--shm_name",
         default="",
-        help="Path to the temporary array file.",
+        help="Name of the shared memory block used to return the image.",
+    )
+    parser.add_argument(
+        "--additional_output_dp",
+        default="",
+        help="Path to a directory to store additional output.",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep the process (and the loaded snapshot) alive and process "
+        "render requests (length prefixed json dicts) read from stdin.",
     )
 
     return parser
 
 
-def write_np_array_to_file(np_array, temp_ofp, use_pickle):
-    """Copy of photogrammetry_importer.file_communication.write_np_array_to_file"""
-    serialized_np_array = serialize_numpy_array(
-        np_array, use_pickle=use_pickle
-    )
-    with open(temp_ofp, "wb") as f:
-        f.write(serialized_np_array)
+def attach_shared_memory(shm_name):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    if os.name == "posix":
+        # The shared memory block is owned (and unlinked) by the parent
+        # process. Prevent the resource tracker of this process from unlinking
+        # it as well (https://bugs.python.org/issue39959).
+        from multiprocessing import resource_tracker
 
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
 
-def serialize_numpy_array(np_array, use_pickle=False):
-    """Copy of photogrammetry_importer.serialization.serialize_numpy_array"""
-    if use_pickle:
-        serialized_np_array = pickle.dumps(np_array)
-    else:
-        memory_file = io.BytesIO()
-        np.save(memory_file, np_array)
-        serialized_np_array = memory_file.getvalue()
-    return serialized_np_array
+
+def write_image_array_to_shared_memory(np_array, shm_name):
+    """Copy of photogrammetry_importer.shared_memory_communication.write_image_array_to_shared_memory"""
+    height, width, channels = np_array.shape
+    shm = attach_shared_memory(shm_name)
+    assert 12 + np_array.size * 4 <= shm.size
+    header = np.ndarray((3,), dtype="<u4", buffer=shm.buf)
+    header[:] = (width, height, channels)
+    shared_np_array = np.ndarray(
+        (height, width, channels), dtype="<f4", buffer=shm.buf, offset=12
+    )
+    shared_np_array[:] = np_array
+    # Release the views before closing the shared memory
+    del header, shared_np_array
+    shm.close()
 
 
 def configure_testbed(testbed, args):
@@ -142,10 +161,7 @@ def post_process_image(img):
     return img
 
 
-def create_single_screenshot(testbed, args):
-    with open(args.temp_json_ifp) as f:
-        ref_transforms = json.load(f)
-
+def create_single_screenshot(testbed, ref_transforms, samples_per_pixel):
     print("ref_transforms")
     print(ref_transforms)
 
@@ -166,17 +182,65 @@ def create_single_screenshot(testbed, args):
     image = testbed.render(
         int(ref_transforms["w"]),
         int(ref_transforms["h"]),
-        args.samples_per_pixel,
+        samples_per_pixel,
         True,
     )
     image = post_process_image(image)
     return image
 
 
+def redirect_stdout_to_stderr():
+    """Reserve stdout for the responses sent to the parent process.
+
+    Output of the script and of the (native) view synthesis library is
+    redirected to stderr, so it can not interfere with the responses.
+    """
+    response_file = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return response_file
+
+
+def read_request(request_stream):
+    """Copy of photogrammetry_importer.pipe_communication.read_json_from_length_prefixed_stream"""
+    length_prefix = request_stream.read(4)
+    if len(length_prefix) < 4:
+        return None
+    (length,) = struct.unpack("<I", length_prefix)
+    return json.loads(request_stream.read(length).decode("raw_unicode_escape"))
+
+
+def write_response(response_file, response):
+    response_file.write(json.dumps(response) + "\n")
+    response_file.flush()
+
+
+def run_daemon(testbed, response_file):
+    # The parent process closes stdin to stop the daemon
+    while True:
+        request = read_request(sys.stdin.buffer)
+        if request is None or request["cmd"] == "exit":
+            break
+        try:
+            img_np_array = create_single_screenshot(
+                testbed, request["transforms"], request["spp"]
+            )
+            write_image_array_to_shared_memory(
+                img_np_array, request["shm_name"]
+            )
+            response = {"status": "ok"}
+        except Exception as e:
+            response = {"status": "error", "message": str(e)}
+        write_response(response_file, response)
+
+
 if __name__ == "__main__":
     parser = create_args_parser()
     args = parser.parse_args()
 
+    if args.daemon:
+        response_file = redirect_stdout_to_stderr()
+
     for system_dp in args.additional_system_dps:
         assert os.path.isdir(system_dp)
         sys.path.append(system_dp)
@@ -190,5 +254,12 @@ if __name__ == "__main__":
 
     testbed.load_snapshot(args.load_snapshot)
     configure_testbed(testbed, args)
-    img_np_array = create_single_screenshot(testbed, args)
-    write_np_array_to_file(img_np_array, args.temp_array_ofp, use_pickle=False)
+    if args.daemon:
+        run_daemon(testbed, response_file)
+    else:
+        with open(args.temp_json_ifp) as f:
+            ref_transforms = json.load(f)
+        img_np_array = create_single_screenshot(
+            testbed, ref_transforms, args.samples_per_pixel
+        )
+        write_image_array_to_shared_memory(img_np_array, args.shm_name)
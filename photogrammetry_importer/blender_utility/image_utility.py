@@ -2,6 +2,21 @@ import os
 import bpy
 
 
+def create_image_lazy(image_name, width, height):
+    """Return the Blender image with the given name (create it if necessary).
+
+    Reusing the image avoids creating a new data-block (with a numbered
+    suffix such as ".001") each time the image is updated.
+    """
+    if image_name not in bpy.data.images:
+        image = bpy.data.images.new(image_name, width, height)
+    else:
+        image = bpy.data.images[image_name]
+        if image.size[0] != width or image.size[1] != height:
+            image.scale(width, height)
+    return image
+
+
 def save_image_to_disk(image_name, file_path, save_alpha=True):
     """Save a Blender image to disk."""
 
@@ -3,11 +3,16 @@ import bpy
 
 def get_selected_object():
     """Get the selected object or return None."""
-    selection_names = [obj.name for obj in bpy.context.selected_objects]
-    if len(selection_names) == 0:
+    # This function is called by poll() and draw() methods, i.e. very
+    # frequently. Thus, avoid iterating over the selection in Python and the
+    # additional (name based) lookup in bpy.data.objects.
+    #
+    # Note: The result is intentionally not cached across calls, since
+    # references to Blender objects become invalid after undo / redo.
+    selected_objects = bpy.context.selected_objects
+    if len(selected_objects) == 0:
         return None
-    selected_obj = bpy.data.objects[selection_names[0]]
-    return selected_obj
+    return selected_objects[0]
 
 
 def get_selected_empty():
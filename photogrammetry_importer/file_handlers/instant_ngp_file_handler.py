@@ -130,12 +130,8 @@ class InstantNGPFileHandler:
             assert cam_1.height == cam_2.height
 
     @classmethod
-    def write_instant_ngp_file(
-        cls, ofp, cameras, ref_centroid_shift=None, op=None
-    ):
-        """Write cameras and points as :code:`Instant-NGP` json file."""
-        log_report("INFO", f"Write Instant-NGP json file: {ofp}", op)
-
+    def create_instant_ngp_json_data(cls, cameras, ref_centroid_shift=None):
+        """Create the json data of an :code:`Instant-NGP` json file."""
         cls._ensure_consistent_values(cameras)
         reference_camera = cameras[0]
         cx, cy = reference_camera.get_principal_point()
@@ -190,6 +186,35 @@ class InstantNGPFileHandler:
 
             json_frames.append(json_frame)
         json_data["frames"] = json_frames
+        return json_data
+
+    @classmethod
+    def write_instant_ngp_file(
+        cls, ofp, cameras, ref_centroid_shift=None, op=None
+    ):
+        """Write cameras and points as :code:`Instant-NGP` json file."""
+        log_report("INFO", f"Write Instant-NGP json file: {ofp}", op)
 
-        with open(ofp, "w") as f:
-            json.dump(json_data, f, indent=4)
+        json_data = cls.create_instant_ngp_json_data(
+            cameras, ref_centroid_shift=ref_centroid_shift
+        )
+
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
+        if orjson is not None:
+            # Orjson is considerably faster than json - especially for files
+            # with many cameras.
+            with open(ofp, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        json_data,
+                        option=orjson.OPT_INDENT_2
+                        | orjson.OPT_SERIALIZE_NUMPY,
+                    )
+                )
+        else:
+            with open(ofp, "w") as f:
+                json.dump(json_data, f, indent=2)
@@ -209,9 +209,13 @@ def get_calibration_mat(blender_camera, op=None):
 
 
 def get_computer_vision_camera_transformation_matrix(
-    blender_camera, check_scale=True, op=None
+    blender_camera, check_scale=True, matrix_world=None, op=None
 ):
-    """Derive camera transformation matrix from a Blender camera."""
+    """Derive camera transformation matrix from a Blender camera.
+
+    If :code:`matrix_world` is provided, it is used instead of the
+    :code:`matrix_world` of the Blender camera.
+    """
 
     # Only if the objects have a scale of 1, the 3x3 part
     # of the corresponding matrix_world contains a pure rotation.
@@ -224,7 +228,9 @@ def get_computer_vision_camera_transformation_matrix(
         )
         assert False
 
-    camera_matrix = np.array(blender_camera.matrix_world)
+    if matrix_world is None:
+        matrix_world = blender_camera.matrix_world
+    camera_matrix = np.array(matrix_world)
     blender_camera_rotation_inverse = camera_matrix.copy()[0:3, 0:3]
     blender_camera_rotation = blender_camera_rotation_inverse.T
 
@@ -248,14 +254,20 @@ def get_computer_vision_camera(
     image_dp=None,
     camera_index=None,
     check_scale=True,
+    matrix_world=None,
     op=None,
 ):
-    """Derive a camera object from a Blender camera object."""
+    """Derive a camera object from a Blender camera object.
+
+    If :code:`matrix_world` is provided, it is used instead of the
+    :code:`matrix_world` of the Blender camera. This allows to derive cameras
+    with modified poses without copying the Blender camera object.
+    """
 
     calibration_mat = get_calibration_mat(blender_camera)
     camera_matrix_computer_vision = (
         get_computer_vision_camera_transformation_matrix(
-            blender_camera, check_scale, op
+            blender_camera, check_scale, matrix_world=matrix_world, op=op
         )
     )
 
@@ -9,6 +9,9 @@ from photogrammetry_importer.types.point import Point
 from photogrammetry_importer.opengl.draw_manager import DrawManager
 from photogrammetry_importer.blender_utility.object_utility import add_empty
 from photogrammetry_importer.blender_utility.logging_utility import log_report
+from photogrammetry_importer.blender_utility.image_utility import (
+    create_image_lazy,
+)
 
 
 def _draw_coords_with_color(
@@ -165,20 +168,10 @@ def render_opengl_image(image_name, cam, coords, colors, point_size):
 
     offscreen.free()
 
-    image = _create_image_lazy(image_name, width, height)
+    image = create_image_lazy(image_name, width, height)
     _copy_buffer_to_pixel(buffer, image, width, height)
 
 
-def _create_image_lazy(image_name, width, height):
-    if image_name not in bpy.data.images:
-        image = bpy.data.images.new(image_name, width, height)
-    else:
-        image = bpy.data.images[image_name]
-        if image.size[0] != width or image.size[1] != height:
-            image.scale(width, height)
-    return image
-
-
 def _copy_buffer_to_pixel(buffer, image, width, height):
     # According to
     #   https://developer.blender.org/D2734
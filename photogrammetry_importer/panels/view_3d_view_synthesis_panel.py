@@ -3,10 +3,12 @@ from bpy.props import (
     StringProperty,
     EnumProperty,
     IntProperty,
+    BoolProperty,
     PointerProperty,
 )
 from photogrammetry_importer.panels.view_synthesis_operators import (
     RunViewSynthesisOperator,
+    ViewSynthesisWorker,
 )
 
 
@@ -63,6 +65,13 @@ class ViewSynthesisPanelSettings(bpy.types.PropertyGroup):
         description="",
         default="path/to/instant-ngp/data/nerf/fox_colmap/snapshot.msgpack",
     )
+    use_persistent_worker: BoolProperty(
+        name="Keep View Synthesis Process Alive",
+        description="Keep the view synthesis process (and the loaded "
+        "snapshot) alive between renderings. Requires a script supporting "
+        "the --daemon option.",
+        default=False,
+    )
     samples_per_pixel: IntProperty(
         name="Samples Per Pixel",
         description="",
@@ -85,6 +94,26 @@ class ViewSynthesisPanel(bpy.types.Panel):
     bl_region_type = "UI"
     bl_category = "PhotogrammetryImporter"
 
+    # Properties (and corresponding labels) shown in the panel
+    _execution_environment_props = {
+        "CONDA": (
+            ("conda_exe_fp", "Conda Executable File Path"),
+            ("conda_env_name", "Conda Environment Name"),
+        ),
+        "DEFAULT PYTHON": (
+            ("python_exe_fp", "Default Python Executable Name or File Path"),
+        ),
+    }
+    _script_props = (
+        ("additional_system_dps", "Additional System Paths"),
+        ("additional_output_dp", "Additional Output Path"),
+        ("view_synthesis_executable_fp", "Script"),
+        ("view_synthesis_snapshot_fp", "Training Snapshot (Trained Model)"),
+        ("samples_per_pixel", "Samples Per Pixel"),
+        ("use_persistent_worker", "Keep View Synthesis Process Alive"),
+        ("rotation_anchor_obj_name", "Rotation Anchor Object"),
+    )
+
     @classmethod
     def poll(cls, context):
         """Return the availability status of the panel."""
@@ -106,6 +135,7 @@ class ViewSynthesisPanel(bpy.types.Panel):
         bpy.utils.unregister_class(ViewSynthesisPanelSettings)
         del bpy.types.Scene.view_synthesis_panel_settings
         bpy.utils.unregister_class(RunViewSynthesisOperator)
+        ViewSynthesisWorker.release_singleton()
 
     def draw(self, context):
         """Draw the panel with corrresponding properties and operators."""
@@ -113,56 +143,17 @@ class ViewSynthesisPanel(bpy.types.Panel):
         layout = self.layout
         view_synthesis_box = layout.box()
 
-        row = view_synthesis_box.row()
-        row.prop(settings, "execution_environment", text="Script Environment")
-        if settings.execution_environment == "CONDA":
-            row = view_synthesis_box.row()
-            row.prop(
-                settings, "conda_exe_fp", text="Conda Executable File Path"
-            )
-            row = view_synthesis_box.row()
-            row.prop(settings, "conda_env_name", text="Conda Environment Name")
-        elif settings.execution_environment == "DEFAULT PYTHON":
-            row = view_synthesis_box.row()
-            row.prop(
-                settings,
-                "python_exe_fp",
-                text="Default Python Executable Name or File Path",
-            )
-        else:
-            pass
-
-        row = view_synthesis_box.row()
-        row.prop(
-            settings,
-            "additional_system_dps",
-            text="Additional System Paths",
-        )
-        row = view_synthesis_box.row()
-        row.prop(
-            settings,
-            "additional_output_dp",
-            text="Additional Output Path",
-        )
-        row = view_synthesis_box.row()
-        row.prop(
-            settings,
-            "view_synthesis_executable_fp",
-            text="Script",
-        )
-        row = view_synthesis_box.row()
-        row.prop(
-            settings,
-            "view_synthesis_snapshot_fp",
-            text="Training Snapshot (Trained Model)",
-        )
-        row = view_synthesis_box.row()
-        row.prop(settings, "samples_per_pixel", text="Samples Per Pixel")
-
-        row = view_synthesis_box.row()
-        row.prop(
-            settings, "rotation_anchor_obj_name", text="Rotation Anchor Object"
+        # Use a single (aligned) column instead of creating a separate row
+        # for each property, since panels are redrawn very frequently.
+        col = view_synthesis_box.column(align=True)
+        col.prop(settings, "execution_environment", text="Script Environment")
+        env_props = self._execution_environment_props.get(
+            settings.execution_environment, ()
         )
+        for prop_name, prop_text in env_props:
+            col.prop(settings, prop_name, text=prop_text)
+        for prop_name, prop_text in self._script_props:
+            col.prop(settings, prop_name, text=prop_text)
 
         row = view_synthesis_box.row()
         row.operator(RunViewSynthesisOperator.bl_idname)
@@ -1,10 +1,14 @@
 import sys
 import subprocess
+from subprocess import PIPE
 import os
+import queue
+import threading
+import functools
 import numpy as np
 import bpy
-from mathutils import Matrix
 from tempfile import NamedTemporaryFile
+from contextlib import contextmanager, ExitStack
 
 
 from photogrammetry_importer.utility.np_utility import (
@@ -14,6 +18,9 @@ from photogrammetry_importer.blender_utility.retrieval_utility import (
     get_selected_camera,
 )
 from photogrammetry_importer.blender_utility.logging_utility import log_report
+from photogrammetry_importer.blender_utility.image_utility import (
+    create_image_lazy,
+)
 from photogrammetry_importer.importers.camera_utility import (
     load_background_image,
     get_computer_vision_camera,
@@ -22,13 +29,369 @@ from photogrammetry_importer.file_handlers.instant_ngp_file_handler import (
     InstantNGPFileHandler,
 )
 from photogrammetry_importer.process_communication.subprocess_command import (
-    create_subprocess_command,
+    create_subprocess_command_prefix,
+    get_conda_env_dp,
+    get_conda_env_python_exe_fp,
+    has_conda_activation_scripts,
+    create_conda_env_variables,
+)
+from photogrammetry_importer.process_communication.shared_memory_communication import (
+    create_image_shared_memory,
+    read_image_array_from_shared_memory,
+)
+from photogrammetry_importer.process_communication.pipe_communication import (
+    write_json_as_length_prefixed_binary_string,
 )
-from photogrammetry_importer.process_communication.file_communication import (
-    read_np_array_from_file,
+from photogrammetry_importer.process_communication.serialization import (
+    deserialize_json_dict,
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_cmd_prefix(
+    execution_environment, conda_exe_fp, conda_env_name, python_exe_fp
+):
+    """Return the command prefix and the environment variables.
+
+    The results are cached, since resolving the conda environment requires
+    to call conda - which is comparatively slow. If the conda environment
+    can not be resolved, a LookupError is raised. Since lru_cache does not
+    cache exceptions, the resolution is repeated with the next call (e.g.
+    after the environment has been created).
+    """
+    env = None
+    if execution_environment == "CONDA":
+        conda_env_dp = get_conda_env_dp(conda_exe_fp, conda_env_name)
+        if conda_env_dp is not None:
+            conda_python_exe_fp = get_conda_env_python_exe_fp(conda_env_dp)
+        else:
+            conda_python_exe_fp = None
+        if conda_python_exe_fp is None:
+            raise LookupError(
+                f"Could not resolve the conda environment {conda_env_name}"
+            )
+        if has_conda_activation_scripts(conda_env_dp):
+            # The variables set by the activation scripts (e.g. CUDA_HOME)
+            # are only available with "conda run".
+            command_prefix = create_subprocess_command_prefix(
+                conda_exe_fp=conda_exe_fp, conda_env_name=conda_env_name
+            )
+        else:
+            # Calling the interpreter of the environment directly is
+            # considerably faster than using "conda run".
+            command_prefix = create_subprocess_command_prefix(
+                python_exe_fp=conda_python_exe_fp
+            )
+            env = create_conda_env_variables(conda_env_dp, conda_env_name)
+    elif execution_environment == "DEFAULT PYTHON":
+        command_prefix = create_subprocess_command_prefix(
+            python_exe_fp=python_exe_fp
+        )
+    return tuple(command_prefix), env
+
+
+@functools.lru_cache(maxsize=8)
+def _create_static_parameters(
+    view_synthesis_snapshot_fp, additional_system_dps, additional_output_dp
+):
+    """Return the parameters that do not change between renderings."""
+    parameter_list = ["--load_snapshot", view_synthesis_snapshot_fp]
+    if additional_system_dps.strip() != "":
+        parameter_list += [
+            "--additional_system_dps",
+            additional_system_dps,
+        ]
+    if additional_output_dp.strip() != "":
+        parameter_list += [
+            "--additional_output_dp",
+            additional_output_dp,
+        ]
+    return tuple(parameter_list)
+
+
+def create_instant_ngp_cmd(
+    settings, temp_json_fp=None, shared_memory_name=None, run_as_daemon=False
+):
+    """Create the command (and environment) to run the view synthesis.
+
+    The result is written to the shared memory block with the name
+    :code:`shared_memory_name`. If :code:`run_as_daemon` is True, the command
+    starts a process that processes multiple requests (see
+    :code:`ViewSynthesisWorker`). In this case the temporary json file and
+    the shared memory block are provided with each request.
+    """
+    parameter_list = list(
+        _create_static_parameters(
+            settings.view_synthesis_snapshot_fp,
+            settings.additional_system_dps,
+            settings.additional_output_dp,
+        )
+    )
+    if run_as_daemon:
+        parameter_list += ["--daemon"]
+    else:
+        parameter_list += ["--temp_json_ifp", temp_json_fp]
+        parameter_list += ["--shm_name", shared_memory_name]
+        parameter_list += [
+            "--samples_per_pixel",
+            str(settings.samples_per_pixel),
+        ]
+
+    # The existence of the script is checked in RunViewSynthesisOperator.poll()
+    view_synthesis_exe_or_script_fp = settings.view_synthesis_executable_fp
+    cmd_prefix_key = (
+        settings.execution_environment,
+        settings.conda_exe_fp,
+        settings.conda_env_name,
+        settings.python_exe_fp,
+    )
+    try:
+        command_prefix, env = _resolve_cmd_prefix(*cmd_prefix_key)
+        if env is not None and not os.access(command_prefix[0], os.X_OK):
+            # The cached conda environment is not available anymore
+            _resolve_cmd_prefix.cache_clear()
+            command_prefix, env = _resolve_cmd_prefix(*cmd_prefix_key)
+    except LookupError:
+        command_prefix = create_subprocess_command_prefix(
+            conda_exe_fp=settings.conda_exe_fp,
+            conda_env_name=settings.conda_env_name,
+        )
+        env = None
+    command = list(command_prefix)
+    command += [view_synthesis_exe_or_script_fp]
+    command += parameter_list
+    return command, env
+
+
+def compute_relative_matrix(anchor_matrix_world_inverse, cam_matrix_world):
+    """Compute the camera matrix relative to the anchor object.
+
+    Supports a single (4x4) camera matrix as well as a stack of camera
+    matrices with shape (N, 4, 4), which are transformed with a single call.
+    """
+    return np.matmul(
+        anchor_matrix_world_inverse, np.asarray(cam_matrix_world, dtype=float)
+    )
+
+
+def get_anchor_inverse(scene):
+    """Return the inverse matrix and the centroid shift of the anchor.
+
+    The matrix is computed once and can be applied to an arbitrary number of
+    cameras with apply_anchor_inverse().
+    """
+    anchor_obj = bpy.data.objects[
+        scene.view_synthesis_panel_settings.rotation_anchor_obj_name
+    ]
+    anchor_matrix_world_inverse = invert_transformation_matrix(
+        np.array(anchor_obj.matrix_world)
+    )
+    # if the anchor obj was shifted to the center during import
+    # apply the reverse translation so that the camera is relative to the original coordinate system
+    centroid_shift = anchor_obj.get("centroid_shift", None)
+    if centroid_shift is not None:
+        anchor_matrix_world_inverse[0, 3] += centroid_shift[0]
+        anchor_matrix_world_inverse[1, 3] += centroid_shift[1]
+        anchor_matrix_world_inverse[2, 3] += centroid_shift[2]
+    return anchor_matrix_world_inverse, centroid_shift
+
+
+def apply_anchor_inverse(anchor_matrix_world_inverse, camera_obj):
+    """Return the (computer vision) camera relative to the anchor."""
+    # Compute the camera pose relative to the anchor without copying the
+    # camera object, i.e. without creating an additional data-block.
+    camera_matrix_world_relative_to_anchor = compute_relative_matrix(
+        anchor_matrix_world_inverse, camera_obj.matrix_world
+    )
+    return get_computer_vision_camera(
+        camera_obj,
+        camera_obj.name,
+        check_scale=False,
+        matrix_world=camera_matrix_world_relative_to_anchor,
+    )
+
+
+def show_image_in_blender(image_shared_memory, camera_name):
+    """Show the view synthesis result as background image of the camera."""
+    img_np_array = read_image_array_from_shared_memory(image_shared_memory)
+
+    blender_image = create_image_lazy(
+        "view_synthesis_result",
+        width=img_np_array.shape[1],
+        height=img_np_array.shape[0],
+    )
+    # Blender stores the rows of an image from bottom to top. Create a single
+    # contiguous (flipped) float32 copy, since foreach_set() copies
+    # contiguous buffers directly - while assigning to blender_image.pixels
+    # iterates over the individual values.
+    img_np_array_flipped = np.ascontiguousarray(
+        img_np_array[::-1], dtype=np.float32
+    )
+    blender_image.pixels.foreach_set(img_np_array_flipped.reshape(-1))
+    load_background_image(blender_image, camera_name)
+
+
+@contextmanager
+def tmp_resources(width, height, create_json_file=True):
+    """Provide a temporary json file and shared memory for the result.
+
+    Both are released when leaving the context - also if an exception is
+    raised. Otherwise, the temporary files would be kept on windows (since
+    they are created with delete=False). If :code:`create_json_file` is
+    False, None is provided instead of the temporary json file.
+    """
+    if not create_json_file:
+        temp_json_file = None
+    elif sys.platform == "linux":
+        temp_json_file = NamedTemporaryFile()
+    elif sys.platform == "win32":
+        temp_json_file = NamedTemporaryFile(delete=False)
+        # Required for windows (https://docs.python.org/3.9/library/tempfile.html)
+        #  Whether the name can be used to open the file a second time, while the named temporary file is still open,
+        #  varies across platforms (it can be so used on Unix; it cannot on Windows)
+        temp_json_file.close()
+    else:
+        assert False
+
+    try:
+        # The child process writes the result directly into shared memory,
+        # i.e. the image is not written to disk.
+        image_shared_memory = create_image_shared_memory(width, height)
+        try:
+            yield temp_json_file, image_shared_memory
+        finally:
+            image_shared_memory.close()
+            image_shared_memory.unlink()
+    finally:
+        if temp_json_file is not None:
+            temp_json_file.close()
+            if sys.platform == "win32":
+                # Required for windows (https://docs.python.org/3.9/library/tempfile.html)
+                os.unlink(temp_json_file.name)
+
+
+_WORKER_START_ERROR_MSG = (
+    "Could not start the view synthesis process. Make sure that the script"
+    " supports the --daemon option or disable the persistent process."
 )
 
 
+class ViewSynthesisWorker:
+    """Class that keeps a view synthesis process alive between renderings.
+
+    This avoids initializing the Python environment, the view synthesis
+    framework and the trained model (i.e. the snapshot) for each rendering.
+    Requests are sent as length prefixed json dicts to the :code:`stdin` of
+    the process, each response is returned as a single json line on
+    :code:`stdout`.
+    """
+
+    def __init__(self):
+        self._child_process = None
+        self._command = None
+        self._response_queue = None
+        self._is_busy = False
+
+    @classmethod
+    def get_singleton(cls):
+        """Return a singleton of this class."""
+        if hasattr(bpy.types.Scene, "current_view_synthesis_worker"):
+            worker = bpy.types.Scene.current_view_synthesis_worker
+        else:
+            worker = cls()
+            bpy.types.Scene.current_view_synthesis_worker = worker
+        return worker
+
+    @classmethod
+    def release_singleton(cls):
+        """Stop the process of the singleton (if available)."""
+        if hasattr(bpy.types.Scene, "current_view_synthesis_worker"):
+            bpy.types.Scene.current_view_synthesis_worker.stop()
+            del bpy.types.Scene.current_view_synthesis_worker
+
+    def is_running(self):
+        """Return True, if the worker process is running."""
+        return (
+            self._child_process is not None
+            and self._child_process.poll() is None
+        )
+
+    def start(self, command, env=None):
+        """Start the worker process (if not already running).
+
+        If the process is running with a different command (e.g. since the
+        snapshot has changed), the process is restarted.
+        """
+        if self.is_running() and self._command == command:
+            return
+        self.stop()
+        self._child_process = subprocess.Popen(
+            command, stdin=PIPE, stdout=PIPE, env=env
+        )
+        self._command = command
+        self._response_queue = queue.Queue()
+        # The responses are read in a separate thread, since reading the
+        # pipe blocks (and non-blocking pipes are not supported on windows).
+        response_thread = threading.Thread(
+            target=self._read_responses,
+            args=(self._child_process.stdout, self._response_queue),
+            daemon=True,
+        )
+        response_thread.start()
+
+    @staticmethod
+    def _read_responses(stdout, response_queue):
+        for line in stdout:
+            response_queue.put(deserialize_json_dict(line))
+        response_queue.put({"status": "terminated"})
+
+    def is_busy(self):
+        """Return True, if the worker is processing a request."""
+        return self.is_running() and self._is_busy
+
+    def send_request(self, request):
+        """Send a request (i.e. a json dict) to the worker process."""
+        request_serialized = write_json_as_length_prefixed_binary_string(
+            request
+        )
+        self._is_busy = True
+        self._child_process.stdin.write(request_serialized)
+        self._child_process.stdin.flush()
+
+    def get_response(self):
+        """Return the response of the worker or None if not available."""
+        try:
+            response = self._response_queue.get_nowait()
+        except queue.Empty:
+            return None
+        self._is_busy = False
+        return response
+
+    def stop(self, terminate=False):
+        """Stop the worker process.
+
+        If :code:`terminate` is True, the process is terminated immediately
+        (i.e. without waiting for the current request).
+        """
+        if self._child_process is None:
+            return
+        if self.is_running():
+            if not terminate:
+                # Closing stdin signals the worker to exit
+                self._child_process.stdin.close()
+                try:
+                    self._child_process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    terminate = True
+            if terminate:
+                self._child_process.terminate()
+                self._child_process.wait()
+        self._child_process = None
+        self._command = None
+        self._response_queue = None
+        self._is_busy = False
+
+
 class RunViewSynthesisOperator(bpy.types.Operator):  # ImportHelper
     """An Operator to save a rendering of the point cloud as Blender image."""
 
@@ -40,151 +403,177 @@ class RunViewSynthesisOperator(bpy.types.Operator):  # ImportHelper
     def poll(cls, context):
         """Return the availability status of the operator."""
         cam = get_selected_camera()
-        return cam is not None
+        if cam is None:
+            return False
+        settings = context.scene.view_synthesis_panel_settings
+        if not os.path.isfile(settings.view_synthesis_executable_fp):
+            cls.poll_message_set("The view synthesis script does not exist")
+            return False
+        return True
 
     def execute(self, context):
-        """Compute a view synthesis for the current camera."""
+        """Start the view synthesis for the current camera."""
 
         log_report(
             "INFO", "Compute view synthesis for current camera: ...", self
         )
         scene = context.scene
+        # The persistent worker receives the cameras with the request, i.e.
+        # it does not require a temporary json file.
+        use_worker = scene.view_synthesis_panel_settings.use_persistent_worker
 
-        if sys.platform == "linux":
-            temp_json_file = NamedTemporaryFile()
-            temp_array_file = NamedTemporaryFile()
-        elif sys.platform == "win32":
-            temp_json_file = NamedTemporaryFile(delete=False)
-            temp_array_file = NamedTemporaryFile(delete=False)
-            # Required for windows (https://docs.python.org/3.9/library/tempfile.html)
-            #  Whether the name can be used to open the file a second time, while the named temporary file is still open,
-            #  varies across platforms (it can be so used on Unix; it cannot on Windows)
-            temp_json_file.close()
-            temp_array_file.close()
-        else:
-            assert False
-
-        if (
-            scene.view_synthesis_panel_settings.execution_environment
-            == "CONDA"
-        ):
-            conda_exe_fp = scene.view_synthesis_panel_settings.conda_exe_fp
-            conda_env_name = scene.view_synthesis_panel_settings.conda_env_name
-            python_exe_fp = None
-        elif (
-            scene.view_synthesis_panel_settings.execution_environment
-            == "DEFAULT PYTHON"
-        ):
-            python_exe_fp = scene.view_synthesis_panel_settings.python_exe_fp
-            conda_exe_fp = None
-            conda_env_name = None
-
-        view_synthesis_exe_or_script_fp = (
-            scene.view_synthesis_panel_settings.view_synthesis_executable_fp
-        )
-        view_synthesis_snapshot_fp = (
-            scene.view_synthesis_panel_settings.view_synthesis_snapshot_fp
-        )
-        additional_system_dps = (
-            scene.view_synthesis_panel_settings.additional_system_dps
-        )
-        additional_output_dp = (
-            scene.view_synthesis_panel_settings.additional_output_dp
-        )
-        samples_per_pixel = (
-            scene.view_synthesis_panel_settings.samples_per_pixel
-        )
+        with ExitStack() as exit_stack:
+            # The image size corresponds to the camera size used by
+            # get_computer_vision_camera().
+            temp_json_file, image_shared_memory = exit_stack.enter_context(
+                tmp_resources(
+                    scene.render.resolution_x,
+                    scene.render.resolution_y,
+                    create_json_file=not use_worker,
+                )
+            )
+            result = self._start_view_synthesis(
+                context, temp_json_file, image_shared_memory
+            )
+            if result == {"RUNNING_MODAL"}:
+                # Keep the temporary resources until modal() is finished
+                self._exit_stack = exit_stack.pop_all()
+        return result
 
-        parameter_list = ["--load_snapshot", view_synthesis_snapshot_fp]
-        parameter_list += ["--temp_json_ifp", temp_json_file.name]
-        parameter_list += ["--temp_array_ofp", temp_array_file.name]
-        parameter_list += ["--samples_per_pixel", str(samples_per_pixel)]
-        if additional_system_dps.strip() != "":
-            parameter_list += [
-                "--additional_system_dps",
-                additional_system_dps,
-            ]
-        if additional_output_dp.strip() != "":
-            parameter_list += [
-                "--additional_output_dp",
-                additional_output_dp,
-            ]
-
-        assert os.path.isfile(view_synthesis_exe_or_script_fp)
-        assert os.path.isfile(temp_json_file.name)
-        assert os.path.isfile(temp_array_file.name)
-
-        command = create_subprocess_command(
-            view_synthesis_exe_or_script_fp,
-            parameter_list,
-            python_exe_fp=python_exe_fp,
-            conda_exe_fp=conda_exe_fp,
-            conda_env_name=conda_env_name,
-        )
+    def _start_view_synthesis(
+        self, context, temp_json_file, image_shared_memory
+    ):
+        scene = context.scene
+        settings = scene.view_synthesis_panel_settings
+        use_worker = settings.use_persistent_worker
+        if use_worker:
+            command, env = create_instant_ngp_cmd(settings, run_as_daemon=True)
+        else:
+            command, env = create_instant_ngp_cmd(
+                settings, temp_json_file.name, image_shared_memory.name
+            )
         cmd_call = " ".join(command)
         log_report("INFO", cmd_call, self)
 
-        anchor_obj = bpy.data.objects[
-            scene.view_synthesis_panel_settings.rotation_anchor_obj_name
-        ]
-        anchor_matrix_world = invert_transformation_matrix(
-            np.array(anchor_obj.matrix_world)
-        )
-        # if the anchor obj was shifted to the center during import
-        # apply the reverse translation so that the camera is relative to the original coordinate system
-        centroid_shift = anchor_obj.get("centroid_shift", None)
-        if centroid_shift is not None:
-            anchor_matrix_world[0, 3] += centroid_shift[0]
-            anchor_matrix_world[1, 3] += centroid_shift[1]
-            anchor_matrix_world[2, 3] += centroid_shift[2]
-
-        anchor_matrix_world_inverse = Matrix(anchor_matrix_world)
-
+        anchor_matrix_world_inverse, centroid_shift = get_anchor_inverse(scene)
         camera_obj = get_selected_camera()
-        camera_obj_relative_to_anchor = camera_obj.copy()
-        camera_obj_relative_to_anchor.matrix_world = (
-            anchor_matrix_world_inverse
-            @ camera_obj_relative_to_anchor.matrix_world
+        camera_relative_to_anchor = apply_anchor_inverse(
+            anchor_matrix_world_inverse, camera_obj
         )
 
-        camera_relative_to_anchor = get_computer_vision_camera(
-            camera_obj_relative_to_anchor,
-            camera_obj_relative_to_anchor.name,
-            check_scale=False,
-        )
+        if not use_worker:
+            # Call before executing the child process
+            InstantNGPFileHandler.write_instant_ngp_file(
+                temp_json_file.name,
+                [camera_relative_to_anchor],
+                ref_centroid_shift=centroid_shift,
+            )
+
+        self._image_shared_memory = image_shared_memory
+        self._camera_name = camera_obj.name
+        # Do not wait for the child process (i.e. do not call communicate()),
+        # since this would block Blender's user interface until the view
+        # synthesis is finished. Instead, the process is polled in modal().
+        if use_worker:
+            self._child_process = None
+            self._worker = ViewSynthesisWorker.get_singleton()
+            if self._worker.is_busy():
+                log_report(
+                    "ERROR", "A view synthesis is already running.", self
+                )
+                return {"CANCELLED"}
+            self._worker.start(command, env)
+            transforms = InstantNGPFileHandler.create_instant_ngp_json_data(
+                [camera_relative_to_anchor], ref_centroid_shift=centroid_shift
+            )
+            try:
+                self._worker.send_request(
+                    {
+                        "cmd": "render",
+                        "transforms": transforms,
+                        "shm_name": image_shared_memory.name,
+                        "spp": settings.samples_per_pixel,
+                    }
+                )
+            except OSError:
+                self._worker.stop()
+                log_report("ERROR", _WORKER_START_ERROR_MSG, self)
+                return {"CANCELLED"}
+        else:
+            self._worker = None
+            self._child_process = subprocess.Popen(command, env=env)
 
-        # Call before executing the child process
-        InstantNGPFileHandler.write_instant_ngp_file(
-            temp_json_file.name,
-            [camera_relative_to_anchor],
-            ref_centroid_shift=centroid_shift,
+        window_manager = context.window_manager
+        self._timer = window_manager.event_timer_add(
+            0.1, window=context.window
         )
+        window_manager.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
 
-        child_process = subprocess.Popen(command)
-        child_process.communicate()
+    def modal(self, context, event):
+        """Check the status of the view synthesis process."""
+        if event.type == "ESC":
+            self.cancel(context)
+            log_report(
+                "WARNING",
+                "Compute view synthesis for current camera: Cancelled",
+                self,
+            )
+            return {"CANCELLED"}
 
-        # Call after executing the child process
-        img_np_array = read_np_array_from_file(
-            temp_array_file.name, use_pickle=False
-        )
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
 
-        blender_image = bpy.data.images.new(
-            "view_synthesis_result",
-            width=img_np_array.shape[1],
-            height=img_np_array.shape[0],
-        )
-        img_np_array_flipped = np.flipud(img_np_array)
-        blender_image.pixels = img_np_array_flipped.ravel()
-        load_background_image(blender_image, camera_obj.name)
+        if self._worker is not None:
+            response = self._worker.get_response()
+            if response is None:
+                return {"PASS_THROUGH"}
+            success = response["status"] == "ok"
+            if response["status"] == "terminated":
+                # The process exited without sending a response, e.g. since
+                # the script does not support the --daemon option.
+                error_msg = _WORKER_START_ERROR_MSG
+            else:
+                error_msg = "View synthesis worker failed: " + str(response)
+        else:
+            if self._child_process.poll() is None:
+                return {"PASS_THROUGH"}
+            success = self._child_process.returncode == 0
+            error_msg = "View synthesis script failed with exit code " + str(
+                self._child_process.returncode
+            )
 
-        if sys.platform == "win32":
-            # Required for windows (https://docs.python.org/3.9/library/tempfile.html)
-            temp_json_file.close()
-            temp_array_file.close()
-            os.unlink(temp_json_file.name)
-            os.unlink(temp_array_file.name)
+        if not success:
+            self._finish(context)
+            log_report("ERROR", error_msg, self)
+            return {"CANCELLED"}
 
+        # Call after executing the child process
+        try:
+            show_image_in_blender(self._image_shared_memory, self._camera_name)
+        finally:
+            self._finish(context)
         log_report(
             "INFO", "Compute view synthesis for current camera: Done", self
         )
         return {"FINISHED"}
+
+    def cancel(self, context):
+        """Stop the view synthesis process and release the resources.
+
+        Blender calls this method (instead of :code:`modal()`), if the modal
+        handler is removed - e.g. when loading a file or closing the window.
+        """
+        if self._worker is not None:
+            # A running rendering can only be interrupted by stopping the
+            # worker - the next rendering starts a new worker process.
+            self._worker.stop(terminate=True)
+        else:
+            self._child_process.terminate()
+            self._child_process.wait()
+        self._finish(context)
+
+    def _finish(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        # Release the temporary json file and the shared memory
+        self._exit_stack.close()
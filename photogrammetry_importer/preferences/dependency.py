@@ -304,6 +304,9 @@ class OptionalDependencyManager:
                 package_name="pyntcloud",
                 import_name="pyntcloud",
             ),
+            OptionalDependency(
+                gui_name="Orjson", package_name="orjson", import_name="orjson"
+            ),
         )
 
     def install_dependencies(self, dependency_package_name="", op=None):
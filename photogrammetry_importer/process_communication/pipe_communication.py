@@ -1,3 +1,4 @@
+import struct
 from photogrammetry_importer.process_communication.serialization import (
     serialize_string,
     serialize_json_dict,
@@ -63,3 +64,27 @@ def _find_serialize_meta_information(lines):
             binary_end_index = index
             break
     return binary_start_index, binary_end_index
+
+
+def write_json_as_length_prefixed_binary_string(json_dict):
+    """Serialize json dict with a prefix encoding the length in bytes.
+
+    The length is encoded as little-endian unsigned 32 bit integer. This
+    allows to send multiple json dicts over a single (persistent) pipe.
+    """
+    json_dict_serialized = serialize_json_dict(json_dict)
+    length_prefix = struct.pack("<I", len(json_dict_serialized))
+    return length_prefix + json_dict_serialized
+
+
+def read_json_from_length_prefixed_stream(stream):
+    """Read a json dict written with a length prefix from a binary stream.
+
+    Returns None, if the end of the stream is reached.
+    """
+    length_prefix = stream.read(4)
+    if len(length_prefix) < 4:
+        return None
+    (length,) = struct.unpack("<I", length_prefix)
+    json_dict_serialized = stream.read(length)
+    return deserialize_json_dict(json_dict_serialized)
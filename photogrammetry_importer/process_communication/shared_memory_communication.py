@@ -0,0 +1,58 @@
+import numpy as np
+
+# Header of the image block, i.e. width, height and number of channels
+RAW_IMAGE_HEADER_DTYPE = np.dtype("<u4")
+RAW_IMAGE_HEADER_SIZE = 3 * RAW_IMAGE_HEADER_DTYPE.itemsize
+RAW_IMAGE_DTYPE = np.dtype("<f4")
+
+
+def create_image_shared_memory(width, height, channels=4):
+    """Create a shared memory block that can hold an image array.
+
+    The block consists of a header (width, height and number of channels as
+    uint32 values) followed by the raw float32 values of the image.
+    """
+    # Import multiprocessing only if required, since all modules of the addon
+    # are imported when the addon is loaded (see setup_addon_modules()).
+    from multiprocessing import shared_memory
+
+    size = RAW_IMAGE_HEADER_SIZE
+    size += width * height * channels * RAW_IMAGE_DTYPE.itemsize
+    return shared_memory.SharedMemory(create=True, size=size)
+
+
+def write_image_array_to_shared_memory(np_array, image_shared_memory):
+    """Write an image array (including the header) to shared memory."""
+    height, width, channels = np_array.shape
+    size = RAW_IMAGE_HEADER_SIZE + np_array.size * RAW_IMAGE_DTYPE.itemsize
+    assert size <= image_shared_memory.size
+    header = np.ndarray(
+        (3,), dtype=RAW_IMAGE_HEADER_DTYPE, buffer=image_shared_memory.buf
+    )
+    header[:] = (width, height, channels)
+    shared_np_array = np.ndarray(
+        (height, width, channels),
+        dtype=RAW_IMAGE_DTYPE,
+        buffer=image_shared_memory.buf,
+        offset=RAW_IMAGE_HEADER_SIZE,
+    )
+    shared_np_array[:] = np_array
+
+
+def read_image_array_from_shared_memory(image_shared_memory):
+    """Return a view of the image array stored in shared memory.
+
+    The returned array is not a copy, i.e. it must be released before the
+    shared memory is closed.
+    """
+    header = np.ndarray(
+        (3,), dtype=RAW_IMAGE_HEADER_DTYPE, buffer=image_shared_memory.buf
+    )
+    width, height, channels = (int(value) for value in header)
+    np_array = np.ndarray(
+        (height, width, channels),
+        dtype=RAW_IMAGE_DTYPE,
+        buffer=image_shared_memory.buf,
+        offset=RAW_IMAGE_HEADER_SIZE,
+    )
+    return np_array
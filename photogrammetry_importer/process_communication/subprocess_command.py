@@ -1,19 +1,16 @@
 import os
+import json
+import subprocess
+from subprocess import PIPE
 from sys import platform
 
 
-def create_subprocess_command(
-    script_fp,
-    parameter_list=None,
+def create_subprocess_command_prefix(
     python_exe_fp=None,
     conda_exe_fp=None,
     conda_env_name=None,
 ):
-    """Create a command to execute a script with a Python subprocess."""
-    assert os.path.isfile(script_fp)
-    if parameter_list is None:
-        parameter_list = []
-
+    """Create the part of a command that precedes the script file path."""
     if python_exe_fp is None and conda_exe_fp is None:
         if platform == "linux":
             # python_exe_fp = "/usr/bin/python3"
@@ -29,11 +26,11 @@ def create_subprocess_command(
     assert python_exe_fp is None or conda_exe_fp is None
 
     if python_exe_fp is not None:
-        command = [python_exe_fp]
+        command_prefix = [python_exe_fp]
     if conda_exe_fp is not None:
         if conda_env_name is None:
             conda_env_name = "base"
-        command = [
+        command_prefix = [
             conda_exe_fp,
             "run",
             # https://github.com/conda/conda/issues/9412
@@ -42,7 +39,95 @@ def create_subprocess_command(
             conda_env_name,
             "python",
         ]
+    return command_prefix
+
 
+def create_subprocess_command(
+    script_fp,
+    parameter_list=None,
+    python_exe_fp=None,
+    conda_exe_fp=None,
+    conda_env_name=None,
+):
+    """Create a command to execute a script with a Python subprocess."""
+    assert os.path.isfile(script_fp)
+    if parameter_list is None:
+        parameter_list = []
+
+    command = create_subprocess_command_prefix(
+        python_exe_fp=python_exe_fp,
+        conda_exe_fp=conda_exe_fp,
+        conda_env_name=conda_env_name,
+    )
     command += [script_fp]
     command += parameter_list
     return command
+
+
+def get_conda_env_dp(conda_exe_fp, conda_env_name):
+    """Get the directory of a conda environment or return None."""
+    try:
+        result = subprocess.run(
+            [conda_exe_fp, "info", "--envs", "--json"],
+            stdout=PIPE,
+            stderr=PIPE,
+            check=True,
+        )
+        conda_info = json.loads(result.stdout)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+    if conda_env_name == "base":
+        return conda_info.get("root_prefix")
+    for conda_env_dp in conda_info.get("envs", []):
+        if os.path.basename(conda_env_dp) == conda_env_name:
+            return conda_env_dp
+    return None
+
+
+def get_conda_env_python_exe_fp(conda_env_dp):
+    """Get the Python executable of a conda environment or return None."""
+    if platform == "win32":
+        python_exe_fp = os.path.join(conda_env_dp, "python.exe")
+    else:
+        python_exe_fp = os.path.join(conda_env_dp, "bin", "python")
+    if os.path.isfile(python_exe_fp) and os.access(python_exe_fp, os.X_OK):
+        return python_exe_fp
+    return None
+
+
+def has_conda_activation_scripts(conda_env_dp):
+    """Return True, if packages of the environment use activation scripts.
+
+    Packages such as CUDA or compilers set environment variables (e.g.
+    :code:`CUDA_HOME`) with scripts in :code:`etc/conda/activate.d`.
+    """
+    activate_dp = os.path.join(conda_env_dp, "etc", "conda", "activate.d")
+    return os.path.isdir(activate_dp) and len(os.listdir(activate_dp)) > 0
+
+
+def create_conda_env_variables(conda_env_dp, conda_env_name):
+    """Create the environment variables of an activated conda environment.
+
+    This allows to call the Python executable of the environment directly
+    (instead of using :code:`conda run`), which avoids the startup overhead
+    of conda. Note that activation scripts of conda packages (i.e. scripts in
+    :code:`etc/conda/activate.d`) are not considered - use
+    :code:`has_conda_activation_scripts()` to check if such scripts exist.
+    """
+    if platform == "win32":
+        # Analogous to the directories added by "conda activate"
+        bin_dps = [
+            conda_env_dp,
+            os.path.join(conda_env_dp, "Library", "mingw-w64", "bin"),
+            os.path.join(conda_env_dp, "Library", "usr", "bin"),
+            os.path.join(conda_env_dp, "Library", "bin"),
+            os.path.join(conda_env_dp, "Scripts"),
+        ]
+    else:
+        bin_dps = [os.path.join(conda_env_dp, "bin")]
+    env = dict(os.environ)
+    env["PATH"] = os.pathsep.join(bin_dps + [env.get("PATH", "")])
+    env["CONDA_PREFIX"] = conda_env_dp
+    env["CONDA_DEFAULT_ENV"] = conda_env_name
+    return env